@@ -1,98 +1,108 @@
-import itertools
 import random
 import sys
-from functools import lru_cache
 
-# Configuration: allowed colors and code length
-COLORS = ['red', 'yellow', 'green', 'blue', 'pink', 'brown']
-PEGS = 5
+import numpy as np
 
-@lru_cache(maxsize=None)
-def get_feedback(secret, guess):
+from mm_core import (ALL_CODES, COLORS, N_FEEDBACK, PEGS, code_index, decode_code,
+                     feedback_code, index_feedback, load_fb_table, start_game, write_output)
+
+def entropy_guess(remaining_idx, block=512):
     """
-    Compute Mastermind feedback.
-      - Siyah (black): number of pegs where the guess has the correct color and position.
-      - Beyaz (white): number of correct colors in wrong positions.
-    Both secret and guess are tuples of strings.
+    Choose the remaining candidate whose feedback splits the candidate set most evenly:
+    the guess g minimizing sum_fb p(fb) * log p(fb), where p(fb) is the share of
+    remaining codes that would answer g with feedback fb.
+    Guesses are scored `block` at a time to bound the temporaries.
+    Returns the ALL_CODES index of the chosen guess.
     """
-    black = sum(1 for s, g in zip(secret, guess) if s == g)
-    white = sum(min(secret.count(c), guess.count(c)) for c in set(guess)) - black
-    return (black, white)
+    n = len(remaining_idx)
+    # One candidate: guess it. Two: either one splits them, so take the first.
+    if n <= 2:
+        return remaining_idx[0]
+    fb_table = load_fb_table()
+    offsets = np.arange(block, dtype=np.intp)[:, None] * N_FEEDBACK
+    scores = np.empty(n)
+    for start in range(0, n, block):
+        guesses = remaining_idx[start:start + block]
+        m = len(guesses)
+        # Feedback keys for every (guess, candidate) pair, straight from the feedback table.
+        keys = fb_table[np.ix_(guesses, remaining_idx)]
+        sizes = np.bincount((offsets[:m] + keys).ravel(), minlength=m * N_FEEDBACK).reshape(m, N_FEEDBACK)
+        prob = sizes / n
+        scores[start:start + m] = (prob * np.log(np.where(sizes > 0, prob, 1.0))).sum(1)
+    return remaining_idx[scores.argmin()]
 
-def logical_inference_solver(secret, pegs=PEGS, colors_list=COLORS, num_initial_guesses=3):
+def logical_inference_solver(secret, pegs=PEGS, colors_list=COLORS, num_initial_guesses=3, verbose=False):
     """
     Logical Inference Mastermind Solver
     
     The approach:
     1. Random Exploration: Choose a few (num_initial_guesses) random guesses.
        For each, obtain feedback and narrow the candidate set to those that yield
-       the same feedback against that guess. The feedback from each guess is
-       internally stored as a "premise" (transformed into CNF-like constraints).
-    2. Inference Phase: From the remaining candidate codes, choose the guess that
-       is most "consistent" with all past feedback. Here we compute, for each candidate,
-       a score that sums differences between its predicted feedback for each previous guess
-       and the recorded feedback. The candidate with the smallest score is chosen.
+       the same feedback against that guess. The feedback from each guess acts
+       as a "premise" that the candidate mask enforces from then on.
+    2. Inference Phase: Every remaining candidate code is consistent with all past
+       feedback, so choose among them the one whose feedback is expected to split
+       the candidates most evenly (highest feedback entropy, see entropy_guess).
     3. Iteratively add the new guess’s feedback as an additional constraint and
        filter the candidate list until the secret is found.
+    
+    Per-turn progress is only reported when `verbose` is set; it is buffered and
+    written to stdout in one go when the solver returns.
     """
-    # Generate all possible codes (the full search space)
-    all_codes = list(itertools.product(colors_list, repeat=pegs))
-    remaining = all_codes.copy()  # Candidate codes that are still valid
+    # Feedback is computed on color ids; names are only used for input and output.
+    secret_idx = code_index(start_game(secret, pegs, colors_list))
+    fb_table = load_fb_table()
+    # Candidate codes that are still valid, as a boolean mask over ALL_CODES.
+    mask = np.ones(len(ALL_CODES), dtype=bool)
     guess_history = []
-    premises = []  # Each element is a tuple: (guess, feedback)
+    out = []  # buffered output lines, only filled when verbose
     turn = 0
 
     # Phase 1: Make a few random initial guesses.
     for _ in range(num_initial_guesses):
         turn += 1
-        guess = random.choice(remaining)
+        g = random.choice(np.flatnonzero(mask))
+        guess = decode_code(g, colors_list)
         guess_history.append(guess)
-        fb = get_feedback(secret, guess)
-        print(f"\nTurn {turn}: Guessed -> {list(guess)}")
-        print(f"   ⚫ Siyah (Black): {fb[0]}")
-        print(f"   ⚪ Beyaz (White): {fb[1]}")
-        # Add the (hidden) premise: any valid code must yield this feedback for this guess.
-        premises.append((guess, fb))
-        # Filter candidate codes to those consistent with the new premise.
-        remaining = [code for code in remaining if get_feedback(code, guess) == fb]
+        fb = index_feedback(secret_idx, g)
+        if verbose:
+            out.append(f"\nTurn {turn}: Guessed -> {list(guess)}")
+            out.append(f"   ⚫ Siyah (Black): {fb[0]}")
+            out.append(f"   ⚪ Beyaz (White): {fb[1]}")
+        # Filter candidate codes to those consistent with the new premise: any valid code
+        # must yield this feedback for this guess.
+        mask &= fb_table[g] == feedback_code(fb)
         if fb == (pegs, 0):
-            print(f"\n✅ Secret code found in {turn} turns!")
+            if verbose:
+                out.append(f"\n✅ Secret code found in {turn} turns!")
+            write_output(out)
             return guess_history
 
     # Phase 2: Iterative inference guided by premises.
-    # Choose next guesses from the remaining candidates based on consistency with all premises.
-    while remaining:
+    # Remaining candidates satisfy all premises; pick the one that best splits them.
+    while mask.any():
         turn += 1
-        best_guess = None
-        best_score = float('inf')
-        # For each candidate code, compute a score based on past premises
-        for candidate in remaining:
-            score = 0
-            for (prev_guess, prev_fb) in premises:
-                candidate_fb = get_feedback(candidate, prev_guess)
-                # Increment score based on difference from recorded feedback.
-                score += abs(candidate_fb[0] - prev_fb[0]) + abs(candidate_fb[1] - prev_fb[1])
-            if score < best_score:
-                best_score = score
-                best_guess = candidate
-        if best_guess is None:
-            best_guess = random.choice(remaining)
-        guess = best_guess
+        g = entropy_guess(np.flatnonzero(mask))
+        guess = decode_code(g, colors_list)
         guess_history.append(guess)
-        fb = get_feedback(secret, guess)
-        print(f"\nTurn {turn}: Guessed -> {list(guess)}")
-        print(f"   ⚫ Siyah (Black): {fb[0]}")
-        print(f"   ⚪ Beyaz (White): {fb[1]}")
-        premises.append((guess, fb))
-        # Filter remaining possibilities using all premises
-        remaining = [code for code in remaining if all(get_feedback(code, g) == f for g, f in premises)]
+        fb = index_feedback(secret_idx, g)
+        if verbose:
+            out.append(f"\nTurn {turn}: Guessed -> {list(guess)}")
+            out.append(f"   ⚫ Siyah (Black): {fb[0]}")
+            out.append(f"   ⚪ Beyaz (White): {fb[1]}")
+        # Filter remaining possibilities with the new premise; they already satisfy the earlier ones.
+        mask &= fb_table[g] == feedback_code(fb)
         if fb == (pegs, 0):
-            print(f"\n✅ Secret code found in {turn} turns!")
+            if verbose:
+                out.append(f"\n✅ Secret code found in {turn} turns!")
+            write_output(out)
             return guess_history
-        if not remaining:
-            print("❌ No candidates remain. Terminating search.")
+        if not mask.any():
+            if verbose:
+                out.append("❌ No candidates remain. Terminating search.")
             break
 
+    write_output(out)
     return guess_history
 
 if __name__ == "__main__":
@@ -110,7 +120,7 @@ if __name__ == "__main__":
         sys.exit(0)
     
     secret_code = tuple(user_sequence)
-    history = logical_inference_solver(secret_code, PEGS, COLORS, num_initial_guesses=3)
+    history = logical_inference_solver(secret_code, PEGS, COLORS, num_initial_guesses=3, verbose=True)
     
     print("\nLogical Inference Strategy Guess Sequence:")
     for i, g in enumerate(history, 1):
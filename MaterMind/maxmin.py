@@ -1,60 +1,37 @@
-import itertools
-from functools import lru_cache
 import sys
 
-# ---- Configurations ----
-COLORS = ['red', 'yellow', 'green', 'blue', 'pink', 'brown']
-PEGS = 5
+import numpy as np
 
-@lru_cache(maxsize=None)
-def get_feedback(secret, guess):
-    """
-    Returns the Mastermind feedback (black, white) given secret and guess.
-      - black: Count of pegs that are correct in both color and position.
-      - white: Count of pegs that are the correct color but in the wrong position.
-    Both secret and guess are tuples of strings.
-    """
-    black = sum(1 for s, g in zip(secret, guess) if s == g)
-    white = sum(min(secret.count(c), guess.count(c)) for c in set(guess)) - black
-    return (black, white)
+from mm_core import (ALL_CODES, COLORS, PEGS, code_index, decode_code, encode_code,
+                     feedback_code, index_feedback, load_fb_table, start_game,
+                     worst_partition_sizes, write_output)
 
-def minimax_guess(remaining, all_codes):
+def minimax_guess(mask):
     """
-    For each possible guess in all_codes, simulate the feedback for every code in remaining.
-    Compute the worst-case (largest) partition size.
+    For each possible guess in ALL_CODES, simulate the feedback for every code still set in
+    `mask` (a boolean mask over ALL_CODES). Compute the worst-case (largest) partition size.
     
     Then select the guess that minimizes this worst-case value.
     
-    Finally, if more than one guess achieves that minimal score, prefer one that is in `remaining`.
+    Finally, if more than one guess achieves that minimal score, prefer one that is still in `mask`.
+    Returns the ALL_CODES index of the chosen guess.
+    
+    The worst-case partition sizes of all guesses come from the compiled (or NumPy)
+    kernel in mm_core.worst_partition_sizes.
     """
-    best_score = float('inf')
-    best_guess = None
+    remaining_idx = np.flatnonzero(mask)
+    # One candidate: guess it. Two: guessing either one separates them, so take the first.
+    if len(remaining_idx) <= 2:
+        return int(remaining_idx[0])
     
-    # First pass: find the lowest worst-case partition size among all codes.
-    for guess in all_codes:
-        partition_sizes = {}
-        for possible_secret in remaining:
-            fb = get_feedback(possible_secret, guess)
-            partition_sizes[fb] = partition_sizes.get(fb, 0) + 1
-        worst_partition = max(partition_sizes.values())
-        if worst_partition < best_score:
-            best_score = worst_partition
-            best_guess = guess
+    worst = worst_partition_sizes(remaining_idx)
     
-    # Second pass: try to find a guess with the same best_score that is also in remaining.
-    for guess in all_codes:
-        partition_sizes = {}
-        for possible_secret in remaining:
-            fb = get_feedback(possible_secret, guess)
-            partition_sizes[fb] = partition_sizes.get(fb, 0) + 1
-        worst_partition = max(partition_sizes.values())
-        if worst_partition == best_score and guess in remaining:
-            best_guess = guess
-            break
-
-    return best_guess
+    # Tie-break: among the guesses with the lowest worst case, prefer one that is still a candidate.
+    ties = np.flatnonzero(worst == worst.min())
+    candidates = ties[mask[ties]]
+    return int(candidates[0] if len(candidates) else ties[0])
 
-def mastermind_minimax_solver(secret, pegs=PEGS, colors_list=COLORS):
+def mastermind_minimax_solver(secret, pegs=PEGS, colors_list=COLORS, verbose=False):
     """
     Solves Mastermind using a minimax approach.
     
@@ -62,56 +39,65 @@ def mastermind_minimax_solver(secret, pegs=PEGS, colors_list=COLORS):
       1. Generates all possible codes.
       2. Uses a fixed initial guess for the first move.
       3. Then, at each turn, it chooses the next guess via the minimax criterion (with tie‐breaking preferring candidates from the remaining possibilities).
-      4. After each guess, it displays the guess along with its feedback (black and white counts) and
-         filters the remaining candidate codes.
+      4. After each guess, it records the guess along with its feedback (black and white counts) and
+         filters the remaining candidate codes. With `verbose` set, this log is written to stdout
+         in one go when the solver returns.
     
     Returns the list of guess tuples.
     """
-    all_codes = list(itertools.product(colors_list, repeat=pegs))
-    remaining = all_codes.copy()  # possible secret codes still valid
+    # Feedback is computed on color ids; names are only used for input and output.
+    secret_idx = code_index(start_game(secret, pegs, colors_list))
+    fb_table = load_fb_table()
+    mask = np.ones(len(ALL_CODES), dtype=bool)  # possible secret codes still valid
     guess_history = []
+    out = []  # buffered output lines, only filled when verbose
 
     # Use a fixed initial guess.
     initial_guess = ('red', 'red', 'yellow', 'green', 'blue')
-    guess = initial_guess if initial_guess in all_codes else all_codes[0]
+    initial_idx = encode_code(initial_guess, colors_list) if set(initial_guess) <= set(colors_list) else 0
     
     turn = 0
-    while remaining:
+    while mask.any():
         turn += 1
         
         # For turn 1 use the fixed initial guess; afterwards use minimax (preferring a valid candidate).
         if turn == 1:
-            guess = initial_guess
+            g = initial_idx
         else:
-            guess = minimax_guess(remaining, all_codes)
+            g = minimax_guess(mask)
         
+        guess = decode_code(g, colors_list)
         guess_history.append(guess)
-        feedback = get_feedback(secret, guess)
+        feedback = index_feedback(secret_idx, g)
         
-        print(f"\nTurn {turn}: Guessed -> {list(guess)}")
-        print(f"   ⚫ Siyah (Black): {feedback[0]}")
-        print(f"   ⚪ Beyaz (White): {feedback[1]}")
+        if verbose:
+            out.append(f"\nTurn {turn}: Guessed -> {list(guess)}")
+            out.append(f"   ⚫ Siyah (Black): {feedback[0]}")
+            out.append(f"   ⚪ Beyaz (White): {feedback[1]}")
         
         # Check if the guess is correct.
         if feedback == (pegs, 0):
-            print(f"\n✅ Secret code found in {turn} turns!")
+            if verbose:
+                out.append(f"\n✅ Secret code found in {turn} turns!")
             break
         
         # Filter remaining possibilities: only those codes that would produce the same feedback for this guess.
-        new_remaining = [code for code in remaining if get_feedback(code, guess) == feedback]
-        if len(new_remaining) == len(remaining):
+        consistent = fb_table[g] == feedback_code(feedback)
+        if not (mask & ~consistent).any():
             # No progress made in filtering; we force removal of the guess from remaining.
-            if guess in remaining:
-                remaining.remove(guess)
-            print("➖ No progress from filtering; forcing removal of the guess.")
+            mask[g] = False
+            if verbose:
+                out.append("➖ No progress from filtering; forcing removal of the guess.")
         else:
-            remaining = new_remaining
+            mask &= consistent
 
         # Safety check: if no candidates remain, terminate.
-        if not remaining:
-            print("❌ No candidates remain. Terminating search.")
+        if not mask.any():
+            if verbose:
+                out.append("❌ No candidates remain. Terminating search.")
             break
     
+    write_output(out)
     return guess_history
 
 if __name__ == "__main__":
@@ -129,7 +115,7 @@ if __name__ == "__main__":
         sys.exit(0)
     
     secret_code = tuple(user_sequence)
-    guesses = mastermind_minimax_solver(secret_code, PEGS, COLORS)
+    guesses = mastermind_minimax_solver(secret_code, PEGS, COLORS, verbose=True)
     
     print("\nMinimax Strategy Guess Sequence:")
     for i, g in enumerate(guesses, 1):
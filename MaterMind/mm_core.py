@@ -0,0 +1,224 @@
+import itertools
+import multiprocessing
+import random
+import sys
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; worst_partition_sizes falls back to NumPy.
+    njit = None
+
+# ------------------------------
+# Configuration shared by the solvers
+# ------------------------------
+COLORS = ['red', 'yellow', 'green', 'blue', 'pink', 'brown']
+PEGS = 5
+COLOR_ID = {c: i for i, c in enumerate(COLORS)}
+
+# Integer encoding of the search space: every code is a uint8 row of color ids 0..5,
+# and ALL_COUNTS[i, c] is the number of pegs of color c in ALL_CODES[i].
+ALL_CODES = np.array(list(itertools.product(range(len(COLORS)), repeat=PEGS)), dtype=np.uint8)
+ALL_COUNTS = np.stack([(ALL_CODES == c).sum(1) for c in range(len(COLORS))], axis=1).astype(np.uint8)
+# The same codes as tuples of color names, built once at import for the solvers' input/output.
+ALL_CODE_NAMES = tuple(itertools.product(COLORS, repeat=PEGS))
+
+# A (black, white) feedback is packed into the single key black * FB_BASE + white.
+FB_BASE = PEGS + 1
+N_FEEDBACK = FB_BASE * FB_BASE
+
+# Precomputed feedback table, see load_fb_table().
+FB = None
+# Worker-side handle keeping a shared-memory FB table mapped, see solve_all().
+_FB_SHM = None
+
+def encode_code(code, colors_list=COLORS):
+    """Return the ALL_CODES index of a tuple of color names."""
+    idx = 0
+    for c in code:
+        idx = idx * len(colors_list) + colors_list.index(c)
+    return idx
+
+def decode_code(idx, colors_list=COLORS):
+    """Return the code ALL_CODES[idx] as a tuple of color names."""
+    if colors_list is COLORS:
+        return ALL_CODE_NAMES[idx]
+    return tuple(colors_list[c] for c in ALL_CODES[idx])
+
+def feedback_code(fb):
+    """Pack a (black, white) feedback tuple into its FB table key."""
+    return fb[0] * FB_BASE + fb[1]
+
+def write_output(out):
+    """Write a solver's buffered output lines to stdout in a single call."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+
+def code_index(ids):
+    """Return the ALL_CODES index of a tuple of color ids."""
+    idx = 0
+    for c in ids:
+        idx = idx * len(COLORS) + c
+    return idx
+
+def index_feedback(secret_idx, guess_idx):
+    """
+    Returns the Mastermind feedback (black, white) of ALL_CODES[guess_idx] against
+    the secret ALL_CODES[secret_idx], read from the FB table (built on first use,
+    see load_fb_table).
+      - black: Count of pegs that are correct in both color and position.
+      - white: Count of pegs that are the correct color but in the wrong position.
+    """
+    return divmod(int(load_fb_table()[secret_idx, guess_idx]), FB_BASE)
+
+@lru_cache(maxsize=200000)
+def get_feedback(secret, guess):
+    """
+    Feedback (black, white) of two tuples of color ids (see COLOR_ID); a thin wrapper
+    over index_feedback kept for callers that work with tuples. The solvers use
+    index_feedback directly.
+    The cache is bounded and cleared by start_game at the start of every game.
+    """
+    return index_feedback(code_index(secret), code_index(guess))
+
+def start_game(secret, pegs=PEGS, colors_list=COLORS):
+    """
+    Per-game setup shared by the solvers: check that the game fits the fixed search
+    space (PEGS pegs, len(COLORS) colors), clear the get_feedback cache so long batch
+    runs don't accumulate entries, and return the secret as a tuple of color ids.
+    Raises ValueError for anything else.
+    """
+    if pegs != PEGS or len(colors_list) != len(COLORS) or len(secret) != PEGS:
+        raise ValueError(f"Only {PEGS}-peg codes over {len(COLORS)} colors are supported")
+    color_id = COLOR_ID if colors_list is COLORS else {c: i for i, c in enumerate(colors_list)}
+    if not set(secret) <= color_id.keys():
+        raise ValueError(f"Secret uses colors outside {list(colors_list)}")
+    get_feedback.cache_clear()
+    return tuple(color_id[c] for c in secret)
+
+def load_fb_table(block=648):
+    """
+    Build (once) and return the feedback table FB, where FB[i, j] is the packed
+    feedback key of code j guessed against secret i. Feedback is symmetric, so
+    FB[g] is also the feedback of guess g against every code.
+    The table is filled `block` secrets at a time to bound the temporaries.
+    """
+    global FB
+    if FB is None:
+        n = len(ALL_CODES)
+        table = np.empty((n, n), dtype=np.uint8)
+        for start in range(0, n, block):
+            rows = slice(start, start + block)
+            black = np.zeros((len(ALL_CODES[rows]), n), dtype=np.uint8)
+            for p in range(PEGS):
+                black += ALL_CODES[rows, p, None] == ALL_CODES[None, :, p]
+            common = np.zeros_like(black)
+            for c in range(len(COLORS)):
+                common += np.minimum(ALL_COUNTS[rows, c, None], ALL_COUNTS[None, :, c])
+            # white = common - black, so the key black * FB_BASE + white folds to:
+            table[rows] = black * (FB_BASE - 1) + common
+        FB = table
+    return FB
+
+def _worst_partitions_numpy(fb_table, remaining_idx, block=512):
+    """
+    NumPy fallback for worst_partition_sizes: an offset bincount per block of
+    `block` guesses, which bounds the temporaries whatever the size of remaining_idx.
+    """
+    n_guesses = fb_table.shape[0]
+    worst = np.empty(n_guesses, dtype=np.int64)
+    offsets = np.arange(block, dtype=np.intp)[:, None] * N_FEEDBACK
+    for start in range(0, n_guesses, block):
+        # keys[g, r]: feedback of guess start + g against remaining code r.
+        keys = fb_table[start:start + block][:, remaining_idx]
+        m = len(keys)
+        sizes = np.bincount((offsets[:m] + keys).ravel(), minlength=m * N_FEEDBACK)
+        worst[start:start + m] = sizes.reshape(m, N_FEEDBACK).max(1)
+    return worst
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _worst_partitions_numba(fb_table, remaining_idx):
+        n_guesses = fb_table.shape[0]
+        worst = np.empty(n_guesses, dtype=np.int64)
+        for g in prange(n_guesses):
+            sizes = np.zeros(N_FEEDBACK, dtype=np.int64)
+            for i in remaining_idx:
+                sizes[fb_table[g, i]] += 1
+            worst[g] = sizes.max()
+        return worst
+else:
+    _worst_partitions_numba = None
+
+def worst_partition_sizes(remaining_idx):
+    """
+    For every guess in ALL_CODES, return the size of the largest partition its
+    feedback splits the `remaining_idx` codes into. Uses the numba kernel
+    (parallel over guesses) when numba is installed, NumPy otherwise.
+    """
+    fb_table = load_fb_table()
+    remaining_idx = np.asarray(remaining_idx, dtype=np.intp)
+    if _worst_partitions_numba is not None:
+        return _worst_partitions_numba(fb_table, remaining_idx)
+    return _worst_partitions_numpy(fb_table, remaining_idx)
+
+def _attach_fb_table(name, shape):
+    """Pool initializer for non-forked workers: map the parent's FB table from shared memory."""
+    global FB, _FB_SHM
+    _FB_SHM = shared_memory.SharedMemory(name=name)
+    FB = np.ndarray(shape, dtype=np.uint8, buffer=_FB_SHM.buf)
+
+def _solve_one(args):
+    """Worker task for solve_all: run one solver on the secret ALL_CODES[i]."""
+    solver, i, seed = args
+    random.seed(seed + i)
+    return i, solver(decode_code(i))
+
+def solve_all(solver, secrets=None, processes=None, seed=0):
+    """
+    Run `solver` (a module-level solver function taking a secret tuple of color
+    names, e.g. maxmin.mastermind_minimax_solver) on every secret in `secrets`
+    (ALL_CODES indices, default: all of them) across a process pool.
+    Each secret i is solved with random.seed(seed + i), so results are reproducible.
+    Returns the guess histories in the order of `secrets`.
+    
+    The FB table is built once in the parent. Forked workers inherit it
+    copy-on-write; workers started any other way map it from shared memory
+    instead of rebuilding it. numba's threading layers are not fork-safe once
+    used, so with the numba kernel available the workers start from a clean
+    forkserver (or spawn) process.
+    """
+    secrets = list(range(len(ALL_CODES)) if secrets is None else secrets)
+    tasks = [(solver, i, seed) for i in secrets]
+    fb_table = load_fb_table()
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and _worst_partitions_numba is None:
+        ctx = multiprocessing.get_context("fork")
+    else:
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    shm = None
+    if ctx.get_start_method() == "fork":
+        initializer, initargs = load_fb_table, ()
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=fb_table.nbytes)
+        np.ndarray(fb_table.shape, dtype=np.uint8, buffer=shm.buf)[:] = fb_table
+        initializer, initargs = _attach_fb_table, (shm.name, fb_table.shape)
+    try:
+        pool = ctx.Pool(processes, initializer=initializer, initargs=initargs)
+        try:
+            results = dict(pool.imap_unordered(_solve_one, tasks, chunksize=16))
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            # On success let the workers exit normally; terminate() would skip their cleanup.
+            pool.close()
+            pool.join()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    return [results[i] for i in secrets]
@@ -0,0 +1,99 @@
+import numpy as np
+from numba import njit
+
+from mm_core import (COLORS, FB_BASE, N_FEEDBACK, PEGS, decode_code, encode_code, load_fb_table,
+                     start_game)
+
+# ------------------------------
+# Ahead-of-time compiled minimax solver
+# ------------------------------
+# Running this file (python mm_native.py) builds the mm_native_ext extension next to it.
+# solve() uses the extension when it has been built and the JIT-compiled kernel otherwise;
+# both follow maxmin.mastermind_minimax_solver guess for guess.
+# numba.pycc warns (pending deprecation) when imported, so only that build step imports it.
+
+N_COLORS = len(COLORS)
+SOLVED = PEGS * FB_BASE  # feedback key of (PEGS, 0)
+INITIAL_GUESS = encode_code(('red', 'red', 'yellow', 'green', 'blue'))
+
+@njit(cache=True)
+def _solve(secret, fb_table):
+    """
+    Minimax solve of `secret` (PEGS color ids) using the feedback table.
+    Returns the ALL_CODES indices of the guesses made, ending with the secret.
+    """
+    n = fb_table.shape[0]
+    secret_idx = 0
+    for c in secret:
+        secret_idx = secret_idx * N_COLORS + c
+    mask = np.ones(n, dtype=np.bool_)
+    history = np.empty(n, dtype=np.int32)
+    turns = 0
+    g = INITIAL_GUESS
+    while True:
+        history[turns] = g
+        turns += 1
+        key = fb_table[secret_idx, g]
+        if key == SOLVED:
+            break
+        # Keep the candidates that reproduce this feedback.
+        left = 0
+        removed = 0
+        for i in range(n):
+            if mask[i]:
+                if fb_table[g, i] != key:
+                    mask[i] = False
+                    removed += 1
+                else:
+                    left += 1
+        if removed == 0 and mask[g]:
+            # No progress made in filtering; force removal of the guess.
+            mask[g] = False
+            left -= 1
+        if left == 0:
+            break
+        remaining = np.flatnonzero(mask)
+        if left <= 2:
+            # Guessing either remaining candidate separates them; take the first.
+            g = remaining[0]
+            continue
+        # Worst-case partition size per guess, then the lowest one, preferring candidates.
+        best_score = n + 1
+        best_guess = -1
+        best_in_remaining = False
+        sizes = np.empty(N_FEEDBACK, dtype=np.int64)
+        for cand in range(n):
+            sizes[:] = 0
+            for i in remaining:
+                sizes[fb_table[cand, i]] += 1
+            worst = sizes.max()
+            if worst < best_score:
+                best_score = worst
+                best_guess = cand
+                best_in_remaining = mask[cand]
+            elif worst == best_score and not best_in_remaining and mask[cand]:
+                best_guess = cand
+                best_in_remaining = True
+        g = best_guess
+    return history[:turns]
+
+try:
+    from mm_native_ext import solve as _solve_aot
+except ImportError:
+    _solve_aot = None
+
+def solve(secret):
+    """
+    Solve a secret (tuple of color names) with the compiled minimax solver.
+    Returns the list of guess tuples, like maxmin.mastermind_minimax_solver, and
+    raises the same ValueError for secrets it cannot solve.
+    """
+    secret_ids = np.array(start_game(secret), dtype=np.uint8)
+    run = _solve_aot if _solve_aot is not None else _solve
+    return [decode_code(g) for g in run(secret_ids, load_fb_table())]
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+    cc = CC('mm_native_ext')
+    cc.export('solve', 'i4[:](u1[:], u1[:, :])')(_solve.py_func)
+    cc.compile()